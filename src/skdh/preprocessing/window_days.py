@@ -7,7 +7,7 @@ Copyright (c) 2024. Pfizer Inc. All rights reserved.
 
 from warnings import warn
 
-from numpy import asarray, int_, mean, diff, abs
+from numpy import asarray, isscalar, mean, diff, abs
 from pandas import DateOffset
 
 from skdh.base import BaseProcess, handle_process_returns
@@ -91,24 +91,27 @@ class GetDayWindowIndices(BaseProcess):
 
         if (bases is None) and (periods is None):
             self.window = False
-            self.bases = asarray([0])  # needs to be defined for passing to extensions
-            self.periods = asarray([12])
+            self.bases = (0,)  # needs to be defined for passing to extensions
+            self.periods = (12,)
         elif (bases is None) or (periods is None):
             warn("One of base or period is None, not windowing", UserWarning)
             self.window = False
-            self.bases = asarray([0])
-            self.periods = asarray([12])
+            self.bases = (0,)
+            self.periods = (12,)
         else:
-            if isinstance(bases, int) and isinstance(periods, int):
-                bases = asarray([bases])
-                periods = asarray([periods])
-            else:
-                bases = asarray(bases, dtype=int_)
-                periods = asarray(periods, dtype=int_)
+            # store as tuples of ints, there are only a handful of values so
+            # there is no need for numpy arrays
+            bases = (int(bases),) if isscalar(bases) else tuple(int(i) for i in bases)
+            periods = (
+                (int(periods),) if isscalar(periods) else tuple(int(i) for i in periods)
+            )
+
+            if len(bases) != len(periods):
+                raise ValueError(
+                    "The number of bases must match the number of periods."
+                )
 
-            if ((0 <= bases) & (bases <= 23)).all() and (
-                (1 <= periods) & (periods <= 24)
-            ).all():
+            if all(0 <= i <= 23 for i in bases) and all(1 <= i <= 24 for i in periods):
                 self.window = True
                 self.bases = bases
                 self.periods = periods
@@ -142,7 +145,7 @@ class GetDayWindowIndices(BaseProcess):
         samples_per_day = int(86400 * fs)
 
         # find the end time for windows
-        w_ends = (asarray(self.bases) + asarray(self.periods)) % 24
+        w_ends = [(b + p) % 24 for b, p in zip(self.bases, self.periods)]
 
         # iterate over the bases and periods
         day_windows = {}
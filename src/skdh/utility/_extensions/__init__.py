@@ -1,18 +1,12 @@
 from .moving_statistics import (
-    moving_mean,
-    moving_sd,
-    moving_skewness,
-    moving_kurtosis,
+    moving_moments,
     moving_median,
     moving_max,
     moving_min,
 )
 
 __all__ = [
-    "moving_mean",
-    "moving_sd",
-    "moving_skewness",
-    "moving_kurtosis",
+    "moving_moments",
     "moving_median",
     "moving_max",
     "moving_min",
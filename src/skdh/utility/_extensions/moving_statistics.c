@@ -12,100 +12,29 @@
 #include "moving_extrema.h"
 
 /* moving moments */
-extern void mov_moments_1(long *, double *, long *, long *, double *);
+extern void mov_moments_1(long *, double *, long *, long *, double *, double *);
 extern void moving_moments_1(long *, double *, long *, long *, double *);
-extern void mov_moments_2(long *, double *, long *, long *, double *, double *);
+extern void mov_moments_2(long *, double *, long *, long *, double *, double *, double *, double *);
 extern void moving_moments_2(long *, double *, long *, long *, double *, double *);
-extern void moving_moments_3(long *, double *, long *, long *, double *, double *, double *);
-extern void moving_moments_4(long *, double *, long *, long *, double *, double *, double *, double *);
+extern void moving_moments_3(long *, double *, long *, long *, double *, double *, double *, double *, double *, double *);
+extern void moving_moments_4(long *, double *, long *, long *, double *, double *, double *, double *, double *, double *, double *, double *);
 /* moving median */
 extern void fmoving_median(long *, double *, long *, long *, double *);
 
 
-PyObject * moving_mean(PyObject *NPY_UNUSED(self), PyObject *args){
+PyObject * moving_moments(PyObject *NPY_UNUSED(self), PyObject *args){
     PyObject *x_;
     long wlen, skip;
-    int trim;
+    int trim, order;
 
-    if (!PyArg_ParseTuple(args, "Ollp:moving_mean", &x_, &wlen, &skip, &trim))
+    if (!PyArg_ParseTuple(args, "Ollpi:moving_moments", &x_, &wlen, &skip, &trim, &order))
         return NULL;
 
-    PyArrayObject *data = (PyArrayObject *)PyArray_FromAny(
-        x_,
-        PyArray_DescrFromType(NPY_DOUBLE),
-        1,
-        0,
-        NPY_ARRAY_ENSUREARRAY | NPY_ARRAY_CARRAY_RO,
-        NULL
-    );
-    if (!data)
-        return NULL;
-
-    // get the number of dimensions, and the shape
-    int ndim = PyArray_NDIM(data);
-    const npy_intp *ddims = PyArray_DIMS(data);
-    long npts = ddims[ndim - 1];
-    long trim_pts = (npts - wlen) / skip + 1;
-    npy_intp *rdims = (npy_intp *)malloc(ndim * sizeof(npy_intp));
-    if (!rdims)
+    if ((order < 1) || (order > 4))
     {
-        Py_XDECREF(data);
+        PyErr_SetString(PyExc_ValueError, "`order` must be between 1 and 4.");
         return NULL;
     }
-    // create return shape
-    for (int i = 0; i < (ndim - 1); ++i)
-    {
-        rdims[i] = ddims[i];
-    }
-    // dimension of the roll
-    if (trim)
-    {
-        rdims[ndim - 1] = trim_pts;
-    } else {
-        rdims[ndim - 1] = (npts - 1) / skip + 1;
-    }
-
-    PyArrayObject *rmean = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    free(rdims);
-
-    if (!rmean)
-    {
-        Py_XDECREF(data);
-        Py_XDECREF(rmean);
-        return NULL;
-    }
-
-    // data pointers
-    double *dptr = (double *)PyArray_DATA(data);
-    double *rmean_ptr = (double *)PyArray_DATA(rmean);
-    // for iterating over the data
-    long res_stride = PyArray_DIM(rmean, ndim - 1);  // stride to get to the next results "column"
-    int nrepeats = PyArray_SIZE(data) / npts;  // number of repetitions to cover all the data
-
-    for (int i = 0; i < nrepeats; ++i)
-    {
-        for (int j = trim_pts; j < res_stride; ++j)
-        {
-            rmean_ptr[j] = NPY_NAN;
-        }
-        mov_moments_1(&npts, dptr, &wlen, &skip, rmean_ptr);
-        dptr += npts;  // increment by number of points in last dimension
-        rmean_ptr += res_stride;
-    }
-
-    Py_XDECREF(data);
-
-    return (PyObject *)rmean;
-}
-
-
-PyObject * moving_sd(PyObject *NPY_UNUSED(self), PyObject *args){
-    PyObject *x_;
-    long wlen, skip;
-    int trim, return_others;
-
-    if (!PyArg_ParseTuple(args, "Ollpp:moving_sd", &x_, &wlen, &skip, &trim, &return_others))
-        return NULL;
 
     PyArrayObject *data = (PyArrayObject *)PyArray_FromAny(
         x_,
@@ -120,10 +49,10 @@ PyObject * moving_sd(PyObject *NPY_UNUSED(self), PyObject *args){
 
     // get the number of dimensions, and the shape
     int ndim = PyArray_NDIM(data);
-    npy_intp *ddims = PyArray_DIMS(data);
-    npy_intp *rdims = (npy_intp *)malloc(ndim * sizeof(ddims));
+    const npy_intp *ddims = PyArray_DIMS(data);
     long npts = ddims[ndim - 1];
     long trim_pts = (npts - wlen) / skip + 1;
+    npy_intp *rdims = (npy_intp *)malloc(ndim * sizeof(npy_intp));
     if (!rdims)
     {
         Py_XDECREF(data);
@@ -142,275 +71,135 @@ PyObject * moving_sd(PyObject *NPY_UNUSED(self), PyObject *args){
         rdims[ndim - 1] = (npts - 1) / skip + 1;
     }
 
-    PyArrayObject *rsd   = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    PyArrayObject *rmean = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
+    // moments are stored in order of mean, sd, skewness, kurtosis
+    PyArrayObject *rmoments[4] = {NULL, NULL, NULL, NULL};
+    double *rptrs[4] = {NULL, NULL, NULL, NULL};
 
-    if ((!rmean) || (!rsd))
+    for (int k = 0; k < order; ++k)
     {
-        free(rdims);  /* make sure it gets freed */
-        Py_XDECREF(data);
-        Py_XDECREF(rmean);
-        Py_XDECREF(rsd);
-        return NULL;
-    }
-
-    // data pointers
-    double *dptr      = (double *)PyArray_DATA(data);
-    double *rmean_ptr = (double *)PyArray_DATA(rmean);
-    double *rsd_ptr   = (double *)PyArray_DATA(rsd);
-    // for iterating over the data
-    long stride = ddims[ndim-1];  // stride to get to the next computation "column"
-    long res_stride = rdims[ndim-1];  // stride to get to the next results "column"
-    int nrepeats = PyArray_SIZE(data) / stride;  // number of repetitions to cover all the data
-    // has to be freed down here since its used by res_stride
-    free(rdims);
-
-    for (int i = 0; i < nrepeats; ++i)
-    {
-        for (int j = trim_pts; j < res_stride; ++j)
+        rmoments[k] = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
+        if (!rmoments[k])
         {
-            rmean_ptr[j] = NPY_NAN;
+            free(rdims);  /* make sure it gets freed */
+            Py_XDECREF(data);
+            for (int j = 0; j < k; ++j)
+            {
+                Py_XDECREF(rmoments[j]);
+            }
+            return NULL;
         }
-        for (int j = trim_pts; j < res_stride; ++j)
-        {
-            rsd_ptr[j] = NPY_NAN;
-        }
-        mov_moments_2(&stride, dptr, &wlen, &skip, rmean_ptr, rsd_ptr);
-        dptr += stride;
-        rmean_ptr += res_stride;
-        rsd_ptr += res_stride;
-    }
-    
-    Py_XDECREF(data);
-
-    if (return_others)
-    {
-        return Py_BuildValue(
-            "NN",  /* dont want to increase ref count */
-            (PyObject *)rsd,
-            (PyObject *)rmean
-        );
-    }
-    else
-    {
-        Py_XDECREF(rmean);
-        return (PyObject *)rsd;
-    }
-}
-
-
-PyObject * moving_skewness(PyObject *NPY_UNUSED(self), PyObject *args){
-    PyObject *x_;
-    long wlen, skip;
-    int trim, return_others;
-
-    if (!PyArg_ParseTuple(args, "Ollpp:moving_skewness", &x_, &wlen, &skip, &trim, &return_others))
-        return NULL;
-
-    PyArrayObject *data = (PyArrayObject *)PyArray_FromAny(
-        x_,
-        PyArray_DescrFromType(NPY_DOUBLE),
-        1,
-        0,
-        NPY_ARRAY_ENSUREARRAY | NPY_ARRAY_CARRAY_RO,
-        NULL
-    );
-    if (!data)
-        return NULL;
-
-    // get the number of dimensions, and the shape
-    int ndim = PyArray_NDIM(data);
-    npy_intp *ddims = PyArray_DIMS(data);
-    npy_intp *rdims = (npy_intp *)malloc(ndim * sizeof(ddims));
-    long npts = ddims[ndim - 1];
-    long trim_pts = (npts - wlen) / skip + 1;
-    if (!rdims)
-    {
-        Py_XDECREF(data);
-        return NULL;
-    }
-    // create return shape
-    for (int i = 0; i < (ndim - 1); ++i)
-    {
-        rdims[i] = ddims[i];
-    }
-    // dimension of the roll
-    if (trim)
-    {
-        rdims[ndim - 1] = trim_pts;
-    } else {
-        rdims[ndim - 1] = (npts - 1) / skip + 1;
-    }
-
-    PyArrayObject *rsd   = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    PyArrayObject *rmean = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    PyArrayObject *rskew = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-
-    if ((!rmean) || (!rsd) || (!rskew))
-    {
-        free(rdims);  /* make sure it gets freed */
-        Py_XDECREF(data);
-        Py_XDECREF(rskew);
-        Py_XDECREF(rsd);
-        Py_XDECREF(rmean);
-        return NULL;
+        rptrs[k] = (double *)PyArray_DATA(rmoments[k]);
     }
 
     // data pointers
-    double *dptr      = (double *)PyArray_DATA(data);
-    double *rmean_ptr = (double *)PyArray_DATA(rmean);
-    double *rsd_ptr   = (double *)PyArray_DATA(rsd);
-    double *rskew_ptr = (double *)PyArray_DATA(rskew);
+    double *dptr = (double *)PyArray_DATA(data);
     // for iterating over the data
-    long stride = ddims[ndim-1];  // stride to get to the next computation "column"
-    long res_stride = rdims[ndim-1];  // stride to get to the next results "column"
-    int nrepeats = PyArray_SIZE(data) / stride;  // number of repetitions to cover all the data
+    long res_stride = rdims[ndim - 1];  // stride to get to the next results "column"
+    int nrepeats = PyArray_SIZE(data) / npts;  // number of repetitions to cover all the data
     // has to be freed down here since its used by res_stride
     free(rdims);
 
-    for (int i = 0; i < nrepeats; ++i)
-    {
-        // splitting up so we are accessing contiguous memory each time
-        for (int j = trim_pts; j < res_stride; ++j)
-        {
-            rmean_ptr[j] = NPY_NAN;
-            rsd_ptr[j] = NPY_NAN;
-            rskew_ptr[j] = NPY_NAN;
-        }
-        moving_moments_3(&stride, dptr, &wlen, &skip, rmean_ptr, rsd_ptr, rskew_ptr);
-        dptr += stride;
-        rmean_ptr += res_stride;
-        rsd_ptr += res_stride;
-        rskew_ptr += res_stride;
-    }
-    
-    Py_XDECREF(data);
+    // the running sum for the mean with skip == 1 doesn't need any scratch space
+    int nwork = ((order == 1) && (skip == 1)) ? 0 : order;
+    int work_failed = 0;
 
-    if (return_others)
+    // each "column" is independent, so they can be computed in parallel. Only
+    // spin up threads if there are enough columns to make it worth it
+    Py_BEGIN_ALLOW_THREADS
+    #pragma omp parallel if (nrepeats > 4)
     {
-        return Py_BuildValue(
-            "NNN",  /* dont want to increase ref count */
-            (PyObject *)rskew,
-            (PyObject *)rsd,
-            (PyObject *)rmean
-        );
-    }
-    else
-    {
-        Py_XDECREF(rmean);
-        Py_XDECREF(rsd);
-        return (PyObject *)rskew;
-    }
-}
+        // scratch space for the cumulative moments. Allocated once per thread and
+        // reused for every column, instead of allocating for each column
+        double *work = NULL;
+        double *w[4] = {NULL, NULL, NULL, NULL};
+        int work_ready = (nwork == 0);
 
+        #pragma omp for schedule(static)
+        for (int i = 0; i < nrepeats; ++i)
+        {
+            // allocate on the first column this thread is given, so that threads
+            // without any columns don't allocate anything
+            if (!work_ready)
+            {
+                work_ready = 1;
+                work = (double *)malloc(nwork * npts * sizeof(double));
+                if (!work)
+                {
+                    #pragma omp atomic write
+                    work_failed = 1;
+                } else {
+                    for (int k = 0; k < nwork; ++k)
+                    {
+                        w[k] = work + (npy_intp)k * npts;
+                    }
+                }
+            }
+            if (nwork > 0 && !work)
+                continue;
+
+            // pointers to this column of the data and results
+            double *dcol = dptr + (npy_intp)i * npts;
+            double *rcol[4] = {NULL, NULL, NULL, NULL};
+
+            for (int k = 0; k < order; ++k)
+            {
+                rcol[k] = rptrs[k] + (npy_intp)i * res_stride;
+                for (int j = trim_pts; j < res_stride; ++j)
+                {
+                    rcol[k][j] = NPY_NAN;
+                }
+            }
+
+            // all the lower moments are computed in the same pass as the highest moment
+            switch (order)
+            {
+                case 1:
+                    mov_moments_1(&npts, dcol, &wlen, &skip, rcol[0], w[0]);
+                    break;
+                case 2:
+                    mov_moments_2(&npts, dcol, &wlen, &skip, rcol[0], rcol[1], w[0], w[1]);
+                    break;
+                case 3:
+                    moving_moments_3(&npts, dcol, &wlen, &skip, rcol[0], rcol[1], rcol[2], w[0], w[1], w[2]);
+                    break;
+                case 4:
+                    moving_moments_4(&npts, dcol, &wlen, &skip, rcol[0], rcol[1], rcol[2], rcol[3], w[0], w[1], w[2], w[3]);
+                    break;
+            }
+        }
 
-PyObject * moving_kurtosis(PyObject *NPY_UNUSED(self), PyObject *args){
-    PyObject *x_;
-    long wlen, skip;
-    int trim, return_others;
-
-    if (!PyArg_ParseTuple(args, "Ollpp:moving_kurtosis", &x_, &wlen, &skip, &trim, &return_others))
-        return NULL;
-
-    PyArrayObject *data = (PyArrayObject *)PyArray_FromAny(
-        x_,
-        PyArray_DescrFromType(NPY_DOUBLE),
-        1,
-        0,
-        NPY_ARRAY_ENSUREARRAY | NPY_ARRAY_CARRAY_RO,
-        NULL
-    );
-    if (!data) return NULL;
-
-    // get the number of dimensions, and the shape
-    int ndim = PyArray_NDIM(data);
-    npy_intp *ddims = PyArray_DIMS(data);
-    npy_intp *rdims = (npy_intp *)malloc(ndim * sizeof(ddims));
-    long npts = ddims[ndim - 1];
-    long trim_pts = (npts - wlen) / skip + 1;
-    if (!rdims)
-    {
-        Py_XDECREF(data);
-        return NULL;
-    }
-    // create return shape
-    for (int i = 0; i < (ndim - 1); ++i)
-    {
-        rdims[i] = ddims[i];
-    }
-    // dimension of the roll
-    if (trim)
-    {
-        rdims[ndim - 1] = trim_pts;
-    } else {
-        rdims[ndim - 1] = (npts - 1) / skip + 1;
-    }
-
-    PyArrayObject *rsd   = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    PyArrayObject *rmean = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    PyArrayObject *rskew = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-    PyArrayObject *rkurt = (PyArrayObject *)PyArray_EMPTY(ndim, rdims, NPY_DOUBLE, 0);
-
-    if (!rmean || !rsd || !rskew || !rkurt)
-    {
-        free(rdims);  /* make sure it gets freed */
-        Py_XDECREF(data);
-        Py_XDECREF(rkurt);
-        Py_XDECREF(rskew);
-        Py_XDECREF(rsd);
-        Py_XDECREF(rmean);
-        return NULL;
+        free(work);
     }
+    Py_END_ALLOW_THREADS
 
-    // data pointers
-    double *dptr      = (double *)PyArray_DATA(data);
-    double *rmean_ptr = (double *)PyArray_DATA(rmean);
-    double *rsd_ptr   = (double *)PyArray_DATA(rsd);
-    double *rskew_ptr = (double *)PyArray_DATA(rskew);
-    double *rkurt_ptr = (double *)PyArray_DATA(rkurt);
-    // for iterating over the data
-    long stride = ddims[ndim-1];  // stride to get to the next computation "column"
-    long res_stride = rdims[ndim-1];  // stride to get to the next results "column"
-    int nrepeats = PyArray_SIZE(data) / stride;  // number of repetitions to cover all the data
-    // has to be freed down here since its used by res_stride
-    free(rdims);
+    Py_XDECREF(data);
 
-    for (int i = 0; i < nrepeats; ++i)
+    if (work_failed)
     {
-        for (int j = trim_pts; j < res_stride; ++j)
+        for (int k = 0; k < order; ++k)
         {
-            rmean_ptr[j] = NPY_NAN;
-            rsd_ptr[j] = NPY_NAN;
-            rskew_ptr[j] = NPY_NAN;
-            rkurt_ptr[j] = NPY_NAN;
+            Py_XDECREF(rmoments[k]);
         }
-        moving_moments_4(&stride, dptr, &wlen, &skip, rmean_ptr, rsd_ptr, rskew_ptr, rkurt_ptr);
-        dptr += stride;
-        rmean_ptr += res_stride;
-        rsd_ptr += res_stride;
-        rskew_ptr += res_stride;
-        rkurt_ptr += res_stride;
+        return PyErr_NoMemory();
     }
-    
-    Py_XDECREF(data);
 
-    if (return_others)
+    // return the highest moment first, followed by the lower moments
+    PyObject *rtuple = PyTuple_New(order);
+    if (!rtuple)
     {
-        return Py_BuildValue(
-            "NNNN",  /* dont want to increase ref count */
-            (PyObject *)rkurt,
-            (PyObject *)rskew,
-            (PyObject *)rsd,
-            (PyObject *)rmean
-        );
+        for (int k = 0; k < order; ++k)
+        {
+            Py_XDECREF(rmoments[k]);
+        }
+        return NULL;
     }
-    else
+    for (int k = 0; k < order; ++k)
     {
-        Py_XDECREF(rmean);
-        Py_XDECREF(rsd);
-        Py_XDECREF(rskew);
-        return (PyObject *)rkurt;
+        /* steals the reference, so no need to decrease the ref count */
+        PyTuple_SET_ITEM(rtuple, k, (PyObject *)rmoments[order - 1 - k]);
     }
+
+    return rtuple;
 }
 
 
@@ -643,97 +432,27 @@ PyObject * moving_min(PyObject *NPY_UNUSED(self), PyObject *args)
 }
 
 
-static const char rmean_doc[] = "moving_mean(a, wlen, skip)\n\n"
-"Compute the rolling mean over windows of length `wlen` with `skip` samples between window starts.\n\n"
-"Paramters\n"
-"---------\n"
-"a : array-like\n"
-"    Array of data to compute the rolling mean for. Computation axis is the last axis.\n"
-"wlen : int\n"
-"    Window size in samples.\n"
-"skip : int\n"
-"    Samples between window starts. `skip=wlen` would result in non-overlapping sequential windows.\n"
-"trim : bool\n"
-"    Trim the ends of the result, where a value cannot be calculated. If False, these values will be set to NaN. Default is True.\n\n"
-"Returns\n"
-"-------\n"
-"rmean : numpy.ndarray\n"
-"    Rolling mean.";
-
-static const char rsd_doc[] = "moving_sd(a, wlen, skip, return_previous)\n\n"
-"Compute the rolling standard deviation over windows of length `wlen` with `skip` samples "
-"between window starts.  Because previous rolling moments have to be computed as part of "
-"the process, they are availble to return as well.\n\n"
-"Paramters\n"
-"---------\n"
-"a : array-like\n"
-"    Array of data to compute the rolling standar deviation for. Computation axis is the last axis.\n"
-"wlen : int\n"
-"    Window size in samples.\n"
-"skip : int\n"
-"    Samples between window starts. `skip=wlen` would result in non-overlapping sequential windows.\n"
-"trim : bool\n"
-"    Trim the ends of the result, where a value cannot be calculated. If False, these values will be set to NaN. Default is True.\n\n"
-"return_previous : bool\n"
-"    Return the previous rolling moments."
-"Returns\n"
-"-------\n"
-"rsd : numpy.ndarray\n"
-"    Rolling sample standard deviation.\n"
-"rmean : numpy.ndarray, optional\n"
-"    Rolling mean. Only returned if `return_previous` is `True`.";
-
-static const char rskew_doc[] = "moving_skewness(a, wlen, skip, return_previous)\n\n"
-"Compute the rolling skewness over windows of length `wlen` with `skip` samples "
-"between window starts.  Because previous rolling moments have to be computed as part of "
-"the process, they are availble to return as well.\n\n"
-"Paramters\n"
-"---------\n"
-"a : array-like\n"
-"    Array of data to compute the rolling skewness for. Computation axis is the last axis.\n"
-"wlen : int\n"
-"    Window size in samples.\n"
-"skip : int\n"
-"    Samples between window starts. `skip=wlen` would result in non-overlapping sequential windows.\n"
-"trim : bool\n"
-"    Trim the ends of the result, where a value cannot be calculated. If False, these values will be set to NaN. Default is True.\n\n"
-"return_previous : bool\n"
-"    Return the previous rolling moments."
-"Returns\n"
-"-------\n"
-"rskew : numpy.ndarray\n"
-"    Rolling skewness.\n"
-"rsd : numpy.ndarray, optional\n"
-"    Rolling sample standard deviation. Only returned if `return_previous` is `True`.\n"
-"rmean : numpy.ndarray, optional\n"
-"    Rolling mean. Only returned if `return_previous` is `True`.";
-
-static const char rkurt_doc[] = "moving_kurtosis(a, wlen, skip, return_previous)\n\n"
-"Compute the rolling kurtosis over windows of length `wlen` with `skip` samples "
-"between window starts.  Because previous rolling moments have to be computed as part of "
-"the process, they are availble to return as well.\n\n"
+static const char rmoments_doc[] = "moving_moments(a, wlen, skip, trim, order)\n\n"
+"Compute the rolling moments up to `order` over windows of length `wlen` with `skip` "
+"samples between window starts. All the moments up to `order` are computed in a single "
+"pass over the data.\n\n"
 "Parameters\n"
-"---------\n"
+"----------\n"
 "a : array-like\n"
-"    Array of data to compute the rolling kurtosis for. Computation axis is the last axis.\n"
+"    Array of data to compute the rolling moments for. Computation axis is the last axis.\n"
 "wlen : int\n"
 "    Window size in samples.\n"
 "skip : int\n"
 "    Samples between window starts. `skip=wlen` would result in non-overlapping sequential windows.\n"
 "trim : bool\n"
-"    Trim the ends of the result, where a value cannot be calculated. If False, these values will be set to NaN. Default is True.\n\n"
-"return_previous : bool\n"
-"    Return the previous rolling moments."
+"    Trim the ends of the result, where a value cannot be calculated. If False, these values will be set to NaN.\n"
+"order : {1, 2, 3, 4}\n"
+"    Highest moment to compute. 1 is the mean, 2 the sample standard deviation, 3 the skewness, "
+"and 4 the kurtosis.\n\n"
 "Returns\n"
 "-------\n"
-"rkurt : numpy.ndarray\n"
-"    Rolling kurtosis.\n"
-"rskew : numpy.ndarray, optional\n"
-"    Rolling skewness. Only returned if `return_previous` is `True`.\n"
-"rsd : numpy.ndarray, optional\n"
-"    Rolling sample standard deviation. Only returned if `return_previous` is `True`.\n"
-"rmean : numpy.ndarray, optional\n"
-"    Rolling mean. Only returned if `return_previous` is `True`.";
+"moments : tuple of numpy.ndarray\n"
+"    Rolling moments, with the highest moment first, eg (kurtosis, skewness, sd, mean) for `order=4`.";
 
 static const char rmed_doc[] = "moving_median(a, wlen, skip)\n\n"
 "Compute the rolling median over windows of length `wlen` with `skip` samples "
@@ -786,10 +505,7 @@ static const char rmin_doc[] = "moving_min(a, wlen, skip)\n\n"
 "    Rolling min.";
 
 static struct PyMethodDef methods[] = {
-    {"moving_mean",   moving_mean,   1, rmean_doc},  // last is the docstring
-    {"moving_sd",   moving_sd,   1, rsd_doc},  // last is the docstring
-    {"moving_skewness",   moving_skewness,   1, rskew_doc},  // last is the docstring
-    {"moving_kurtosis",   moving_kurtosis,   1, rkurt_doc},  // last is the docstring
+    {"moving_moments",   moving_moments,   1, rmoments_doc},  // last is the docstring
     {"moving_median", moving_median, 1, rmed_doc},
     {"moving_max", moving_max, 1, rmax_doc},
     {"moving_min", moving_min, 1, rmin_doc},
@@ -0,0 +1,185 @@
+"""
+Numba fallback for the moving moments extension
+
+Lukas Adamowicz
+Copyright (c) 2021. Pfizer Inc. All rights reserved.
+"""
+
+from numpy import ascontiguousarray, zeros, full, nan, sqrt, float64 as np_float64
+from numba import njit, void, int64, float64
+
+
+__all__ = ["moving_moments", "moving_median", "moving_max", "moving_min"]
+
+
+def _requires_extensions(name):
+    """
+    Create a stand-in for a function which only exists in the compiled extensions.
+    """
+
+    def fn(*args, **kwargs):
+        raise ImportError(
+            f"`{name}` requires the compiled extension module "
+            f"`skdh.utility._extensions`, which could not be imported."
+        )
+
+    fn.__name__ = name
+    return fn
+
+
+# no numba fallback for these, make sure they fail with a clear error
+moving_median = _requires_extensions("moving_median")
+moving_max = _requires_extensions("moving_max")
+moving_min = _requires_extensions("moving_min")
+
+
+@njit(
+    void(float64[:, ::1], int64, int64, int64, float64[:, :, :]),
+    nogil=True,
+    error_model="numpy",
+)
+def _moving_moments(x, wlen, skip, order, out):  # pragma: no cover, compiled
+    """
+    Compute the moving moments for each row of `x`, following the same
+    cumulative moment algorithm as the compiled extension. `out` has shape
+    (order, rows, windows), with moments in order of mean, sd, skewness, kurtosis.
+    """
+    n = x.shape[1]
+    nwin = (n - wlen) // skip + 1
+    eps = 2.220446049250313e-16
+
+    m1 = zeros(n)
+    m2 = zeros(n)
+    m3 = zeros(n)
+    m4 = zeros(n)
+
+    for r in range(x.shape[0]):
+        if order == 2 and skip >= wlen:
+            # non-overlapping windows, use a Welford pass over each window with
+            # Kahan summation for M2, matching the compiled extension
+            for j in range(nwin):
+                wmean = 0.0
+                s1 = 0.0
+                s2 = 0.0
+                comp = 0.0
+                for i in range(wlen):
+                    xi = x[r, j * skip + i]
+                    delta = xi - wmean
+                    wmean += delta / (i + 1)
+                    s1 += xi
+
+                    y = delta * (xi - wmean) - comp
+                    t = s2 + y
+                    comp = (t - s2) - y
+                    s2 = t
+
+                out[0, r, j] = s1 / wlen
+                out[1, r, j] = sqrt(s2 / (wlen - 1))
+            continue
+
+        # cumulative moments
+        m1[0] = x[r, 0]
+        for i in range(1, n):
+            k = i + 1  # number of samples
+            delta = x[r, i] - m1[i - 1] / i
+            delta_n = delta / k
+            delta_n2 = delta_n * delta_n
+            term1 = delta * delta_n * i
+
+            m1[i] = m1[i - 1] + x[r, i]
+            m2[i] = m2[i - 1] + term1
+            if order > 2:
+                m3[i] = m3[i - 1] + term1 * delta_n * (k - 2) - 3 * delta_n * m2[i - 1]
+            if order > 3:
+                m4[i] = (
+                    m4[i - 1]
+                    + term1 * delta_n2 * (k * k - 3 * k + 3)
+                    + 6 * delta_n2 * m2[i - 1]
+                    - 4 * delta_n * m3[i - 1]
+                )
+
+        # combine the cumulative moments into the window moments. Counts are floats
+        # to avoid integer overflow in the higher powers for long series
+        na = float(wlen)
+        for j in range(nwin):
+            e = wlen + j * skip - 1  # index of the window end
+            ib = e + 1 - wlen  # number of samples before the window
+
+            if ib == 0:
+                s1, s2, s3, s4 = m1[e], m2[e], m3[e], m4[e]
+            else:
+                nb = float(ib)
+                nt = nb + na
+                delta = m1[ib - 1] / nb - (m1[e] - m1[ib - 1]) / na
+
+                s1 = m1[e] - m1[ib - 1]
+                s2 = m2[e] - m2[ib - 1] - delta**2 * na * nb / nt
+                s3 = (
+                    m3[e]
+                    - m3[ib - 1]
+                    - delta**3 * na * nb * (2 * na - nt) / nt**2
+                    - 3 * delta * (na * m2[ib - 1] - nb * s2) / nt
+                )
+                s4 = (
+                    m4[e]
+                    - m4[ib - 1]
+                    - delta**4 * na * nb * (na**2 - na * nb + nb**2) / nt**3
+                    - 6 * delta**2 * (na**2 * m2[ib - 1] + nb**2 * s2) / nt**2
+                    - 4 * delta * (na * m3[ib - 1] - nb * s3) / nt
+                )
+
+            if -eps < s2 < 0.0:
+                s2 = -s2
+            # the compiled third order kernel also flips small negative M3 values
+            if order == 3 and -eps < s3 < 0.0:
+                s3 = -s3
+
+            out[0, r, j] = s1 / wlen
+            if order > 1:
+                out[1, r, j] = sqrt(s2 / (wlen - 1))
+            if order > 2:
+                out[2, r, j] = nan if s2 < eps else sqrt(wlen) * s3 / s2**1.5
+            if order > 3:
+                out[3, r, j] = nan if s2 < eps else wlen * s4 / s2**2 - 3
+
+
+def moving_moments(a, wlen, skip, trim, order):
+    """
+    Compute the rolling moments up to `order` over windows of length `wlen` with
+    `skip` samples between window starts. Mirrors the signature and returns of
+    the compiled `moving_moments` extension.
+
+    Parameters
+    ----------
+    a : array-like
+        Array of data to compute the rolling moments for. Computation axis is the
+        last axis.
+    wlen : int
+        Window size in samples.
+    skip : int
+        Samples between window starts.
+    trim : bool
+        Trim the ends of the result, where a value cannot be calculated. If False,
+        these values will be set to NaN.
+    order : {1, 2, 3, 4}
+        Highest moment to compute.
+
+    Returns
+    -------
+    moments : tuple of numpy.ndarray
+        Rolling moments, with the highest moment first.
+    """
+    if order < 1 or order > 4:
+        raise ValueError("`order` must be between 1 and 4.")
+
+    x = ascontiguousarray(a, dtype=np_float64)
+    npts = x.shape[-1]
+    nfill = (npts - wlen) // skip + 1
+    nres = nfill if trim else (npts - 1) // skip + 1
+
+    res = full((order, x.size // npts, nres), nan)
+    # the kernel only fills the valid windows, the rest are left as NaN
+    _moving_moments(x.reshape((-1, npts)), wlen, skip, order, res[:, :, :nfill])
+
+    shape = x.shape[:-1] + (nres,)
+    return tuple(res[k].reshape(shape) for k in range(order - 1, -1, -1))
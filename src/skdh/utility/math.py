@@ -6,6 +6,7 @@ Copyright (c) 2021. Pfizer Inc. All rights reserved.
 """
 
 from warnings import warn
+from operator import index
 
 from numpy import (
     moveaxis,
@@ -23,10 +24,34 @@ from numpy import (
     log,
     exp,
     float64,
+    amax,
+    amin,
 )
 from scipy.stats import linregress
 
-from skdh.utility import _extensions
+try:
+    from numpy.lib.array_utils import normalize_axis_index
+except ImportError:  # numpy < 2.0
+    from numpy.core.multiarray import normalize_axis_index
+
+try:
+    from skdh.utility import _extensions
+except ImportError as e:
+    # compiled extensions are not available, fall back on the numba moving moments.
+    # Note that the moving median, max, and min still require the extensions
+    try:
+        from skdh.utility import _numba_moments as _extensions
+    except ImportError:
+        raise ImportError(
+            "Compiled extensions not found, and optional dependency `numba` not "
+            "found for the fallback. Install using `pip install numba`."
+        ) from e
+
+    warn(
+        f"Compiled extensions could not be imported ({e!r}). Falling back on numba "
+        "for the moving moments. The moving median, max, and min are not available.",
+        UserWarning,
+    )
 from skdh.utility.windowing import get_windowed_view
 
 
@@ -42,6 +67,73 @@ __all__ = [
 ]
 
 
+def _maybe_moveaxis(res, axis, ndim):
+    """
+    Move the computation axis of the result(s) from the end back to `axis`,
+    skipping the move entirely if `axis` is already the last axis.
+    """
+    if axis in (-1, ndim - 1):
+        return res
+    if isinstance(res, tuple):
+        return tuple(moveaxis(i, -1, axis) for i in res)
+    return moveaxis(res, -1, axis)
+
+
+def _validate_window(w_len, skip, x, axis):
+    """
+    Check the window length and skip against each other and the number of samples
+    on the computation axis, returning them as python integers along with the
+    normalized (non-negative) axis.
+    """
+    w_len = index(w_len)
+    skip = index(skip)
+    # raises an AxisError (a ValueError) for axes out of range, including 0-d input
+    axis = normalize_axis_index(axis, x.ndim)
+
+    if w_len <= 0 or skip <= 0:
+        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
+    if w_len > x.shape[axis]:
+        raise ValueError("Window length is larger than the computation axis.")
+
+    return w_len, skip, axis
+
+
+def _windowed_reduce(a, w_len, skip, trim, axis, reduce):
+    """
+    Compute a moving reduction using a windowed view of the data. Any axes other
+    than the computation axis are coalesced into one, so that arrays of any
+    dimension can be windowed as a 2D array.
+    """
+    # move the computation axis to the front for windowing
+    x = moveaxis(asarray(a), axis, 0)
+    lead = x.shape[1:]
+
+    # coalesce the other axes so that the windowing only sees 1 or 2 dimensions
+    if x.ndim > 2:
+        x = x.reshape((x.shape[0], -1))
+    x = ascontiguousarray(x)
+
+    xw = get_windowed_view(x, w_len, skip)
+    # computation axis is still the second axis
+    if trim:
+        res = reduce(xw, axis=1)
+    else:
+        nfill = (x.shape[0] - w_len) // skip + 1
+        rshape = list(x.shape)
+        rshape[0] = (x.shape[0] - 1) // skip + 1
+        res = full(rshape, nan)
+        res[:nfill] = reduce(xw, axis=1)
+
+    if len(lead) > 1:
+        res = res.reshape(res.shape[:1] + lead)
+
+    # match the layout and type of the extension results: float64, contiguous along
+    # the computation axis, which is then moved back to its original place
+    res = ascontiguousarray(moveaxis(res, 0, -1), dtype=float64)
+
+    return moveaxis(res, -1, axis)
+
+
 def moving_mean(a, w_len, skip, trim=True, axis=-1):
     r"""
     Compute the moving mean.
@@ -130,20 +222,20 @@ def moving_mean(a, w_len, skip, trim=True, axis=-1):
     >>> moving_mean(z, 3, 3, axis=2).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
+    x = asarray(a)
+    ndim = x.ndim
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
-    # move computation axis to end
-    x = moveaxis(a, axis, -1)
+    # move computation axis to end, if it is not already there
+    if axis not in (-1, ndim - 1):
+        x = moveaxis(x, axis, -1)
+    # make sure the extension is working on contiguous memory along the computation axis
+    x = ascontiguousarray(x, dtype=float64)
 
-    # check that there are enough samples
-    if w_len > x.shape[-1]:
-        raise ValueError("Window length is larger than the computation axis.")
-
-    rmean = _extensions.moving_mean(x, w_len, skip, trim)
+    (rmean,) = _extensions.moving_moments(x, w_len, skip, trim, 1)
 
     # move computation axis back to original place and return
-    return moveaxis(rmean, -1, axis)
+    return _maybe_moveaxis(rmean, axis, ndim)
 
 
 def moving_sd(a, w_len, skip, trim=True, axis=-1, return_previous=True):
@@ -243,25 +335,22 @@ def moving_sd(a, w_len, skip, trim=True, axis=-1, return_previous=True):
     >>> moving_sd(z, 3, 3, axis=2, return_previous=False).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
+    x = asarray(a)
+    ndim = x.ndim
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
-    # move computation axis to end
-    x = moveaxis(a, axis, -1)
+    # move computation axis to end, if it is not already there
+    if axis not in (-1, ndim - 1):
+        x = moveaxis(x, axis, -1)
+    # make sure the extension is working on contiguous memory along the computation axis
+    x = ascontiguousarray(x, dtype=float64)
 
-    # check that there are enough samples
-    if w_len > x.shape[-1]:
-        raise ValueError(
-            "Cannot have a window length larger than the computation axis."
-        )
-
-    res = _extensions.moving_sd(x, w_len, skip, trim, return_previous)
+    res = _extensions.moving_moments(x, w_len, skip, trim, 2)
+    if not return_previous:
+        res = res[0]
 
     # move computation axis back to original place and return
-    if return_previous:
-        return moveaxis(res[0], -1, axis), moveaxis(res[1], -1, axis)
-    else:
-        return moveaxis(res, -1, axis)
+    return _maybe_moveaxis(res, axis, ndim)
 
 
 def moving_skewness(a, w_len, skip, trim=True, axis=-1, return_previous=True):
@@ -310,8 +399,10 @@ def moving_skewness(a, w_len, skip, trim=True, axis=-1, return_previous=True):
 
     Warnings
     --------
-    While this implementation is quite fast, it is also quite mememory inefficient. 3 arrays
-    of equal length to the computation axis are created during computation, which can easily
+    While this implementation is quite fast, it is also quite memory inefficient. 3 arrays
+    of equal length to the computation axis are created during computation. For inputs with
+    multiple series, these arrays are created per thread computing in parallel, so peak memory
+    scales with the number of threads (controlled by `OMP_NUM_THREADS`). This can easily
     exceed system memory if already using a significant amount of memory.
 
     Examples
@@ -361,28 +452,25 @@ def moving_skewness(a, w_len, skip, trim=True, axis=-1, return_previous=True):
     >>> moving_skewness(z, 3, 3, axis=2, return_previous=False).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
-
-    # move computation axis to end
-    x = moveaxis(a, axis, -1)
+    x = asarray(a)
+    ndim = x.ndim
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
-    # check that there are enough samples
-    if w_len > x.shape[-1]:
-        raise ValueError(
-            "Cannot have a window length larger than the computation axis."
-        )
+    # move computation axis to end, if it is not already there
+    if axis not in (-1, ndim - 1):
+        x = moveaxis(x, axis, -1)
+    # make sure the extension is working on contiguous memory along the computation axis
+    x = ascontiguousarray(x, dtype=float64)
 
-    res = _extensions.moving_skewness(x, w_len, skip, trim, return_previous)
+    res = _extensions.moving_moments(x, w_len, skip, trim, 3)
+    if not return_previous:
+        res = res[0]
 
     if isnan(res).any():
         warn("NaN values present in output, possibly due to catastrophic cancellation.")
 
     # move computation axis back to original place and return
-    if return_previous:
-        return tuple(moveaxis(i, -1, axis) for i in res)
-    else:
-        return moveaxis(res, -1, axis)
+    return _maybe_moveaxis(res, axis, ndim)
 
 
 def moving_kurtosis(a, w_len, skip, trim=True, axis=-1, return_previous=True):
@@ -434,8 +522,10 @@ def moving_kurtosis(a, w_len, skip, trim=True, axis=-1, return_previous=True):
 
     Warnings
     --------
-    While this implementation is quite fast, it is also quite mememory inefficient. 4 arrays
-    of equal length to the computation axis are created during computation, which can easily
+    While this implementation is quite fast, it is also quite memory inefficient. 4 arrays
+    of equal length to the computation axis are created during computation. For inputs with
+    multiple series, these arrays are created per thread computing in parallel, so peak memory
+    scales with the number of threads (controlled by `OMP_NUM_THREADS`). This can easily
     exceed system memory if already using a significant amount of memory.
 
     Examples
@@ -484,28 +574,25 @@ def moving_kurtosis(a, w_len, skip, trim=True, axis=-1, return_previous=True):
     >>> moving_kurtosis(z, 3, 3, axis=2, return_previous=False).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
+    x = asarray(a)
+    ndim = x.ndim
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
-    # move computation axis to end
-    x = moveaxis(a, axis, -1)
+    # move computation axis to end, if it is not already there
+    if axis not in (-1, ndim - 1):
+        x = moveaxis(x, axis, -1)
+    # make sure the extension is working on contiguous memory along the computation axis
+    x = ascontiguousarray(x, dtype=float64)
 
-    # check that there are enough samples
-    if w_len > x.shape[-1]:
-        raise ValueError(
-            "Cannot have a window length larger than the computation axis."
-        )
-
-    res = _extensions.moving_kurtosis(x, w_len, skip, trim, return_previous)
+    res = _extensions.moving_moments(x, w_len, skip, trim, 4)
+    if not return_previous:
+        res = res[0]
 
     if isnan(res).any():
         warn("NaN values present in output, possibly due to catastrophic cancellation.")
 
     # move computation axis back to original place and return
-    if return_previous:
-        return tuple(moveaxis(i, -1, axis) for i in res)
-    else:
-        return moveaxis(res, -1, axis)
+    return _maybe_moveaxis(res, axis, ndim)
 
 
 def moving_median(a, w_len, skip=1, trim=True, axis=-1):
@@ -586,22 +673,18 @@ def moving_median(a, w_len, skip=1, trim=True, axis=-1):
     >>> moving_median(z, 3, 3, axis=2).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
-
-    # move computation axis to end
-    x = moveaxis(a, axis, -1)
+    x = asarray(a)
+    ndim = x.ndim
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
-    # check that there are enough samples
-    if w_len > x.shape[-1]:
-        raise ValueError(
-            "Cannot have a window length larger than the computation axis."
-        )
+    # move computation axis to end, if it is not already there
+    if axis not in (-1, ndim - 1):
+        x = moveaxis(x, axis, -1)
 
     rmed = _extensions.moving_median(x, w_len, skip, trim)
 
     # move computation axis back to original place and return
-    return moveaxis(rmed, -1, axis)
+    return _maybe_moveaxis(rmed, axis, ndim)
 
 
 def moving_max(a, w_len, skip, trim=True, axis=-1):
@@ -682,41 +765,23 @@ def moving_max(a, w_len, skip, trim=True, axis=-1):
     >>> moving_max(z, 3, 3, axis=2).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
+    x = asarray(a)
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
     # Numpy uses SIMD instructions for max/min, so it will likely be faster
     # unless there is a lot of overlap
-    cond1 = a.ndim == 1 and (skip / w_len) < 0.005
-    cond2 = a.ndim > 1 and (skip / w_len) < 0.3  # due to c-contiguity?
-    cond3 = a.ndim > 2  # windowing doesnt handle more than 2 dimensions currently
-    if any([cond1, cond2, cond3]):
+    cond1 = x.ndim == 1 and (skip / w_len) < 0.005
+    cond2 = x.ndim > 1 and (skip / w_len) < 0.3  # due to c-contiguity?
+    if cond1 or cond2:
         # move computation axis to end
-        x = moveaxis(a, axis, -1)
-
-        # check that there are enough samples
-        if w_len > x.shape[-1]:
-            raise ValueError("Window length is larger than the computation axis.")
+        x = moveaxis(x, axis, -1)
 
         rmax = _extensions.moving_max(x, w_len, skip, trim)
 
         # move computation axis back to original place and return
         return moveaxis(rmax, -1, axis)
     else:
-        x = ascontiguousarray(
-            moveaxis(a, axis, 0)
-        )  # need to move axis to the front for windowing
-        xw = get_windowed_view(x, w_len, skip)
-        if trim:
-            res = xw.max(axis=1)  # computation axis is still the second axis
-        else:
-            nfill = (x.shape[0] - w_len) // skip + 1
-            rshape = list(x.shape)
-            rshape[0] = (x.shape[0] - 1) // skip + 1
-            res = full(rshape, nan)
-            res[:nfill] = xw.max(axis=1)
-
-        return moveaxis(res, 0, axis)
+        return _windowed_reduce(x, w_len, skip, trim, axis, amax)
 
 
 def moving_min(a, w_len, skip, trim=True, axis=-1):
@@ -798,41 +863,23 @@ def moving_min(a, w_len, skip, trim=True, axis=-1):
     >>> moving_min(z, 3, 3, axis=2).flags['C_CONTIGUOUS']
     True
     """
-    if w_len <= 0 or skip <= 0:
-        raise ValueError("`wlen` and `skip` cannot be less than or equal to 0.")
+    x = asarray(a)
+    w_len, skip, axis = _validate_window(w_len, skip, x, axis)
 
     # Numpy uses SIMD instructions for max/min, so it will likely be faster
     # unless there is a lot of overlap
-    cond1 = a.ndim == 1 and (skip / w_len) < 0.005
-    cond2 = a.ndim > 1 and (skip / w_len) < 0.3  # due to c-contiguity?
-    cond3 = a.ndim > 2  # windowing doesnt handle more than 2 dimensions currently
-    if any([cond1, cond2, cond3]):
+    cond1 = x.ndim == 1 and (skip / w_len) < 0.005
+    cond2 = x.ndim > 1 and (skip / w_len) < 0.3  # due to c-contiguity?
+    if cond1 or cond2:
         # move computation axis to end
-        x = moveaxis(a, axis, -1)
-
-        # check that there are enough samples
-        if w_len > x.shape[-1]:
-            raise ValueError("Window length is larger than the computation axis.")
+        x = moveaxis(x, axis, -1)
 
         rmin = _extensions.moving_min(x, w_len, skip, trim)
 
         # move computation axis back to original place and return
         return moveaxis(rmin, -1, axis)
     else:
-        x = ascontiguousarray(
-            moveaxis(a, axis, 0)
-        )  # need to move axis to the front for windowing
-        xw = get_windowed_view(x, w_len, skip)
-        if trim:
-            res = xw.min(axis=1)  # computation axis is still the second axis
-        else:
-            nfill = (x.shape[0] - w_len) // skip + 1
-            rshape = list(x.shape)
-            rshape[0] = (x.shape[0] - 1) // skip + 1
-            res = full(rshape, nan)
-            res[:nfill] = xw.min(axis=1)
-
-        return moveaxis(res, 0, axis)
+        return _windowed_reduce(x, w_len, skip, trim, axis, amin)
 
 
 def DFA(a, scale=2 ** (1 / 8), box_sizes=None):
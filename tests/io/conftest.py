@@ -4,8 +4,10 @@ from tempfile import TemporaryDirectory
 from pytest import fixture
 from numpy import load, random, arange, repeat
 import pandas as pd
+import h5py
 
 from skdh import BaseProcess, handle_process_returns
+from skdh.io import ReadCwa, ReadBin
 from skdh.io.base import check_input_file
 
 
@@ -90,6 +92,12 @@ def dummy_process():
     return dummyprocess
 
 
+@fixture(scope="class")
+def bin_reader():
+    # readers only keep per-call state from predict, so can be shared across tests
+    return ReadBin()
+
+
 @fixture
 def gnactv_file(path_tests):
     return path_tests / "io" / "data" / "gnactv_sample.bin"
@@ -105,6 +113,12 @@ def gnactv_truth(path_tests):
     return data
 
 
+@fixture(scope="class")
+def cwa_reader():
+    # readers only keep per-call state from predict, so can be shared across tests
+    return ReadCwa()
+
+
 @fixture
 def ax3_file(path_tests):
     return path_tests / "io" / "data" / "ax3_sample.cwa"
@@ -140,6 +154,24 @@ def apdm_file(path_tests):
     return path_tests / "io" / "data" / "apdm_sample.h5"
 
 
+@fixture(scope="class")
+def apdm_truth(path_tests):
+    # small file, so load it into memory once with the core driver
+    with h5py.File(
+        path_tests / "io" / "data" / "apdm_sample.h5", "r", driver="core"
+    ) as f:
+        sens = f["Sensors"]["XI-010284"]  # lumbar sensor
+
+        data = {
+            "accel": sens["Accelerometer"][()],
+            "time": sens["Time"][()],
+            "gyro": sens["Gyroscope"][()],
+            "temperature": sens["Temperature"][()],
+        }
+
+    return data
+
+
 @fixture
 def dummy_csv_contents():
     def fn(drop=True):
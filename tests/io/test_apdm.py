@@ -1,5 +1,4 @@
 import pytest
-import h5py
 from tempfile import NamedTemporaryFile
 
 from numpy import allclose
@@ -9,38 +8,30 @@ from skdh.io.apdm import SensorNotFoundError
 
 
 class TestApdmReader:
-    def test(self, apdm_file):
+    def test(self, apdm_file, apdm_truth):
         res = ReadApdmH5(
             "Lumbar", localize_timestamps=True, gravity_acceleration=9.81
         ).predict(file=apdm_file)
 
-        lumbar_sens = "XI-010284"
-        with h5py.File(apdm_file) as f:
-            acc = f["Sensors"][lumbar_sens]["Accelerometer"][()] / 9.81
-            time = (
-                f["Sensors"][lumbar_sens]["Time"][()] / 1e6 - 4 * 3600
-            )  # to seconds, convert to local
-            gyro = f["Sensors"][lumbar_sens]["Gyroscope"][()]
-            temp = f["Sensors"][lumbar_sens]["Temperature"][()]
+        acc = apdm_truth["accel"] / 9.81
+        time = apdm_truth["time"] / 1e6 - 4 * 3600  # to seconds, convert to local
+        gyro = apdm_truth["gyro"]
+        temp = apdm_truth["temperature"]
 
         assert allclose(res["accel"], acc)
         assert allclose(res["time"] - time[0], time - time[0])
         assert allclose(res["gyro"], gyro)
         assert allclose(res["temperature"], temp)
 
-    def test_tz(self, apdm_file):
+    def test_tz(self, apdm_file, apdm_truth):
         res = ReadApdmH5(
             "Lumbar", localize_timestamps=True, gravity_acceleration=9.81
         ).predict(file=apdm_file, tz_name="US/Eastern")
 
-        lumbar_sens = "XI-010284"
-        with h5py.File(apdm_file) as f:
-            acc = f["Sensors"][lumbar_sens]["Accelerometer"][()] / 9.81
-            time = (
-                f["Sensors"][lumbar_sens]["Time"][()] / 1e6
-            )  # to seconds, DON'T convert to local
-            gyro = f["Sensors"][lumbar_sens]["Gyroscope"][()]
-            temp = f["Sensors"][lumbar_sens]["Temperature"][()]
+        acc = apdm_truth["accel"] / 9.81
+        time = apdm_truth["time"] / 1e6  # to seconds, DON'T convert to local
+        gyro = apdm_truth["gyro"]
+        temp = apdm_truth["temperature"]
 
         assert allclose(res["accel"], acc)
         assert allclose(res["time"] - time[0], time - time[0])
@@ -4,13 +4,12 @@ import pytest
 from numpy import allclose
 from pandas import to_datetime
 
-from skdh.io import ReadCwa
 from skdh.utility.exceptions import FileSizeError
 
 
 class TestReadCwa:
-    def test_ax3(self, ax3_file, ax3_truth):
-        res = ReadCwa().predict(file=ax3_file)
+    def test_ax3(self, cwa_reader, ax3_file, ax3_truth):
+        res = cwa_reader.predict(file=ax3_file)
 
         # make sure it will catch small differences
         assert allclose(
@@ -24,8 +23,8 @@ class TestReadCwa:
             # were truncated by rounding
             assert allclose(res[k], ax3_truth[k], atol=5e-5)
 
-    def test_ax6(self, ax6_file, ax6_truth):
-        res = ReadCwa().predict(file=ax6_file)
+    def test_ax6(self, cwa_reader, ax6_file, ax6_truth):
+        res = cwa_reader.predict(file=ax6_file)
 
         # make sure it will catch small differences
         assert allclose(
@@ -39,8 +38,8 @@ class TestReadCwa:
             # were truncated by rounding
             assert allclose(res[k], ax6_truth[k], atol=5e-5)
 
-    def test_ax6_tz(self, ax6_file, ax6_truth):
-        res = ReadCwa().predict(file=ax6_file, tz_name="US/Eastern")
+    def test_ax6_tz(self, cwa_reader, ax6_file, ax6_truth):
+        res = cwa_reader.predict(file=ax6_file, tz_name="US/Eastern")
 
         # adjust the truth timestamps
         truth_time_ = to_datetime(ax6_truth["time"], unit="s", utc=False).tz_localize(
@@ -57,18 +56,18 @@ class TestReadCwa:
             # were truncated by rounding
             assert allclose(res[k], ax6_truth[k], atol=5e-5)
 
-    def test_extension(self):
+    def test_extension(self, cwa_reader):
         with NamedTemporaryFile(suffix=".abc") as tmpf:
             with pytest.warns(UserWarning, match=r"expected \[.cwa\]"):
                 with pytest.raises(Exception):
-                    ReadCwa().predict(file=tmpf.name)
+                    cwa_reader.predict(file=tmpf.name)
 
-    def test_small_size(self):
+    def test_small_size(self, cwa_reader):
         ntf = NamedTemporaryFile(mode="w", suffix=".cwa")
 
         ntf.writelines(["a\n", "b\n", "c\n"])
 
         with pytest.raises(FileSizeError):
-            ReadCwa().predict(file=ntf.name)
+            cwa_reader.predict(file=ntf.name)
 
         ntf.close()
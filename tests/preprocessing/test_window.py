@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 
 import pytest
-from numpy import ndarray, int_, arange, allclose
+from numpy import int_, arange, allclose
 import pandas as pd
 
 from skdh.preprocessing import GetDayWindowIndices
@@ -89,8 +89,13 @@ class TestGetDayWindowIndices:
     def test_window_inputs(self):
         w = GetDayWindowIndices(bases=None, periods=None)
         assert not w.window
-        assert isinstance(w.bases, ndarray)
-        assert isinstance(w.periods, ndarray)
+        assert w.bases == (0,)
+        assert w.periods == (12,)
+
+        w = GetDayWindowIndices(bases=8, periods=12)
+        assert w.window
+        assert w.bases == (8,)
+        assert w.periods == (12,)
 
         with pytest.warns(UserWarning) as record:
             w = GetDayWindowIndices(bases=8, periods=None)
@@ -100,6 +105,11 @@ class TestGetDayWindowIndices:
         assert "One of base or period is None" in record[0].message.args[0]
         assert "One of base or period is None" in record[1].message.args[0]
 
+        with pytest.raises(ValueError, match="number of bases must match"):
+            GetDayWindowIndices(bases=[0, 8], periods=[12, 12, 6])
+        with pytest.raises(ValueError, match="number of bases must match"):
+            GetDayWindowIndices(bases=[0, 8, 16], periods=[12, 6])
+
     def test_window_range_error(self):
         with pytest.raises(ValueError):
             GetDayWindowIndices(bases=[0, 24], periods=[5, 26])
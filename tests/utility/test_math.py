@@ -1,7 +1,19 @@
 from collections.abc import Iterable
 
 import pytest
-from numpy import allclose, isclose, mean, std, median, max, min, nan, full, random
+from numpy import (
+    allclose,
+    isclose,
+    mean,
+    std,
+    median,
+    max,
+    min,
+    nan,
+    full,
+    random,
+    float64,
+)
 from scipy.stats import skew, kurtosis
 
 from skdh.utility.windowing import get_windowed_view
@@ -96,6 +108,7 @@ class BaseMovingStatsTester:
             ((500, 5), (21, 5), {"w_len": 100, "skip": 20, "axis": 0}),
             ((500,), (21,), {"w_len": 100, "skip": 20}),
             ((3, 10, 3187), (3, 10, 3015), {"w_len": 173, "skip": 1, "axis": -1}),
+            ((3, 500, 4, 2), (3, 5, 4, 2), {"w_len": 100, "skip": 100, "axis": 1}),
         ),
     )
     def test_in_out_shapes(self, in_shape, out_shape, kwargs, np_rng):
@@ -108,12 +121,52 @@ class BaseMovingStatsTester:
         else:
             assert pred.shape == out_shape
 
+    @pytest.mark.parametrize("trim", (True, False))
+    @pytest.mark.parametrize("skip", (1, 150))
+    def test_nd(self, skip, trim, np_rng):
+        x = np_rng.random((3, 2000, 4, 2))
+
+        pred = self.function(x, 150, skip, trim=trim, axis=1)
+
+        for i in range(3):
+            for j in range(4):
+                for k in range(2):
+                    truth = self.function(x[i, :, j, k], 150, skip, trim=trim)
+
+                    if isinstance(pred, tuple):
+                        for p, t in zip(pred, truth):
+                            assert allclose(p[i, :, j, k], t, equal_nan=True)
+                    else:
+                        assert allclose(pred[i, :, j, k], truth, equal_nan=True)
+
+    @pytest.mark.parametrize("dtype", ("float64", "int64"))
+    @pytest.mark.parametrize(
+        ("axis", "c_contiguous"), ((0, False), (1, False), (2, True), (-1, True))
+    )
+    def test_nd_layout(self, axis, c_contiguous, dtype, np_rng):
+        z = (np_rng.random((10, 10, 10)) * 100).astype(dtype)
+
+        pred = self.function(z, 3, 3, axis=axis)
+
+        for p in pred if isinstance(pred, tuple) else (pred,):
+            assert p.dtype == float64
+            assert p.flags["C_CONTIGUOUS"] == c_contiguous
+
     def test_window_length_shape_error(self, np_rng):
         x = np_rng.random((5, 10))
 
         with pytest.raises(ValueError):
             self.function(x, 11, 1, axis=-1)
 
+    @pytest.mark.parametrize(
+        ("shape", "axis"), (((5, 100), 2), ((5, 100), -3), ((), -1))
+    )
+    def test_axis_error(self, shape, axis, np_rng):
+        x = np_rng.random(shape)
+
+        with pytest.raises(ValueError):
+            self.function(x, 10, 1, axis=axis)
+
     @pytest.mark.parametrize("args", ((-1, 10), (10, -1), (-5, -5)))
     def test_negative_error(self, args, np_rng):
         x = np_rng.random((100, 300))
@@ -121,6 +174,13 @@ class BaseMovingStatsTester:
         with pytest.raises(ValueError):
             self.function(x, *args, axis=-1)
 
+    @pytest.mark.parametrize("args", ((10.5, 10), (10, 2.0)))
+    def test_non_integer_error(self, args, np_rng):
+        x = np_rng.random((100, 300))
+
+        with pytest.raises(TypeError):
+            self.function(x, *args, axis=-1)
+
     @pytest.mark.segfault
     def test_segfault(self, np_rng):
         x = np_rng.random(2000)
@@ -166,6 +226,18 @@ class TestMovingSD(BaseMovingStatsTester):
     truth_function = (std, mean)
     truth_kw = ({"ddof": 1}, {})
 
+    @pytest.mark.parametrize("skip", (1000, 1500))
+    def test_offset_non_overlapping(self, skip, np_rng):
+        # large offset relative to the spread, where differencing cumulative sums
+        # loses precision
+        x = 1e6 + np_rng.random(1_500_000)
+
+        pred = moving_sd(x, 1000, skip, return_previous=False)
+        xw = get_windowed_view(x, 1000, skip)
+        truth = std(xw, axis=1, ddof=1)
+
+        assert allclose(pred, truth, rtol=1e-8, atol=0)
+
 
 class TestMovingSkewness(BaseMovingStatsTester):
     function = staticmethod(moving_skewness)
@@ -183,6 +255,15 @@ class TestMovingKurtosis(BaseMovingStatsTester):
         {},
     )
 
+    def test_long_series(self, np_rng):
+        # long enough that integer powers of the sample counts would overflow
+        x = np_rng.random(3_000_000)
+
+        pred = moving_kurtosis(x, 1000, 1000, return_previous=False)
+        truth = kurtosis(x.reshape((-1, 1000)), axis=1, bias=True)
+
+        assert allclose(pred, truth)
+
 
 class TestMovingMedian(BaseMovingStatsTester):
     function = staticmethod(moving_median)
@@ -202,6 +283,39 @@ class TestMovingMin(BaseMovingStatsTester):
     truth_kw = {}
 
 
+class TestNumbaMovingMoments:
+    @pytest.mark.parametrize("order", (1, 2, 3, 4))
+    @pytest.mark.parametrize("trim", (True, False))
+    @pytest.mark.parametrize("skip", (1, 7, 150, 300))
+    @pytest.mark.parametrize("wlen", (1, 250))
+    def test(self, order, trim, skip, wlen, np_rng):
+        nb_moments = pytest.importorskip("skdh.utility._numba_moments")
+        from skdh.utility._extensions import moving_moments
+
+        x = np_rng.random((3, 2000))
+
+        truth = moving_moments(x, wlen, skip, trim, order)
+        pred = nb_moments.moving_moments(x, wlen, skip, trim, order)
+
+        assert len(pred) == order
+        for p, t in zip(pred, truth):
+            assert p.shape == t.shape
+            assert allclose(p, t, equal_nan=True)
+
+    def test_order_error(self):
+        nb_moments = pytest.importorskip("skdh.utility._numba_moments")
+
+        with pytest.raises(ValueError):
+            nb_moments.moving_moments(full(100, 1.0), 10, 1, True, 5)
+
+    @pytest.mark.parametrize("name", ("moving_median", "moving_max", "moving_min"))
+    def test_extension_only_error(self, name):
+        nb_moments = pytest.importorskip("skdh.utility._numba_moments")
+
+        with pytest.raises(ImportError, match="skdh.utility._extensions"):
+            getattr(nb_moments, name)(full(100, 1.0), 10, 1, True)
+
+
 def test_DFA(np_rng):
     # get 1 axis from acc
     xacc = random.default_rng(seed=1313871834).random(500)